@@ -1,26 +1,66 @@
 """FastAPI web service for YouTube subtitle extraction."""
 
+import asyncio
+import hashlib
+import hmac
 import os
-from typing import Optional
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional, Sequence
 
 from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from dotenv import load_dotenv
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
-from subtitler.core.subtitle_extractor import extract_subtitles
-from subtitler._exceptions import (
+from subtitler import (
+    DEFAULT_LANGUAGES,
     InvalidVideoInputError,
     SubtitleExtractionError,
+    get_video_id,
 )
+from subtitler.core.subtitle_extractor import _extract_subtitles_for_id
 
 # Load environment variables
 load_dotenv()
 
+# Optional Redis cache for extracted subtitles
+REDIS_URL = os.getenv("REDIS_URL")
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "86400"))
+
+# Worker threads for blocking extractions (asyncio defaults to min(32, cpus + 4)).
+# Each thread owns its own HTTP session, so this also bounds YouTube connections.
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "64"))
+
+# Batch endpoint limits
+BATCH_MAX_VIDEOS = int(os.getenv("BATCH_MAX_VIDEOS", "100"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "16"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared clients on startup and close them on shutdown."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS)
+    )
+    app.state.redis = aioredis.from_url(REDIS_URL) if REDIS_URL else None
+    try:
+        yield
+    finally:
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+
+
 app = FastAPI(
     title="YouTube Subtitle Extractor API",
     description="Extract subtitles from YouTube videos",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Security
@@ -31,6 +71,9 @@ API_KEY = os.getenv("API_KEY")
 if not API_KEY:
     raise ValueError("API_KEY environment variable is required")
 
+# Encoded once so each request only encodes the presented key
+_API_KEY_BYTES = API_KEY.encode()
+
 
 class SubtitleRequest(BaseModel):
     """Request model for subtitle extraction."""
@@ -43,6 +86,19 @@ class SubtitleResponse(BaseModel):
     subtitles: str
 
 
+class BatchSubtitleRequest(BaseModel):
+    """Request model for batch subtitle extraction."""
+    videos: list[str] = Field(min_length=1, max_length=BATCH_MAX_VIDEOS)
+    languages: Optional[list[str]] = None
+
+
+class BatchSubtitleResult(BaseModel):
+    """Per-video result of a batch subtitle extraction."""
+    video: str
+    subtitles: Optional[str] = None
+    error: Optional[str] = None
+
+
 class ErrorResponse(BaseModel):
     """Error response model."""
     error: str
@@ -51,7 +107,7 @@ class ErrorResponse(BaseModel):
 
 def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify the API key from the Authorization header."""
-    if credentials.credentials != API_KEY:
+    if not hmac.compare_digest(credentials.credentials.encode(), _API_KEY_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -60,10 +116,64 @@ def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(security)
     return credentials.credentials
 
 
+def _cache_key(video_id: str, languages: Sequence[str]) -> str:
+    """Build the cache key for a video and its language preference order."""
+    raw = f"{video_id}|{','.join(languages)}"
+    return f"sub:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+
+def _encode_cached(subtitles: str) -> bytes:
+    """Compress subtitles for storage in the cache."""
+    return zlib.compress(subtitles.encode())
+
+
+def _decode_cached(data: bytes) -> str:
+    """Decompress subtitles read from the cache."""
+    return zlib.decompress(data).decode()
+
+
+async def get_subtitles(
+    video_id: str, languages: Optional[Sequence[str]]
+) -> str:
+    """
+    Return subtitles for a video ID resolved by get_video_id, serving from
+    the Redis cache when possible.
+
+    Cache errors, including unreadable cached values, are treated as misses
+    so that the cache never fails a request that YouTube itself could answer.
+    """
+    redis = app.state.redis
+    key = _cache_key(video_id, languages or DEFAULT_LANGUAGES)
+
+    if redis is not None:
+        try:
+            cached = await redis.get(key)
+        except RedisError:
+            cached = None
+        if cached is not None:
+            try:
+                return _decode_cached(cached)
+            except (zlib.error, UnicodeDecodeError):
+                pass
+
+    subtitles = await asyncio.to_thread(
+        _extract_subtitles_for_id, video_id, languages
+    )
+
+    if redis is not None:
+        try:
+            await redis.setex(key, CACHE_TTL_SECONDS, _encode_cached(subtitles))
+        except RedisError:
+            pass
+
+    return subtitles
+
+
 @app.post(
     "/extract-subtitles",
-    response_model=SubtitleResponse,
+    response_model=None,
     responses={
+        200: {"model": SubtitleResponse, "description": "Extracted subtitles"},
         400: {"model": ErrorResponse, "description": "Invalid video input"},
         401: {"model": ErrorResponse, "description": "Invalid API key"},
         500: {"model": ErrorResponse, "description": "Subtitle extraction failed"},
@@ -81,17 +191,15 @@ async def extract_subtitles_endpoint(
         api_key: The API key for authentication (provided via Authorization header)
 
     Returns:
-        SubtitleResponse: The extracted subtitles
+        dict: The extracted subtitles, shaped like SubtitleResponse
 
     Raises:
         HTTPException: For various error conditions (invalid input, extraction failure, etc.)
     """
     try:
-        subtitles = extract_subtitles(
-            video_url=request.video_url,
-            languages=request.languages
-        )
-        return SubtitleResponse(subtitles=subtitles)
+        video_id = get_video_id(request.video_url)
+        subtitles = await get_subtitles(video_id, request.languages)
+        return {"subtitles": subtitles}
 
     except InvalidVideoInputError as e:
         raise HTTPException(
@@ -112,6 +220,49 @@ async def extract_subtitles_endpoint(
         ) from e
 
 
+@app.post(
+    "/extract-subtitles/batch",
+    response_model=None,
+    responses={
+        200: {"model": list[BatchSubtitleResult], "description": "Per-video results"},
+        401: {"model": ErrorResponse, "description": "Invalid API key"},
+    }
+)
+async def extract_subtitles_batch_endpoint(
+    request: BatchSubtitleRequest,
+    api_key: str = Depends(verify_api_key)
+):
+    """
+    Extract subtitles from several YouTube videos concurrently.
+
+    Args:
+        request: The batch request containing videos and optional languages
+        api_key: The API key for authentication (provided via Authorization header)
+
+    Returns:
+        list[dict]: One result per video, in request order, shaped like
+        BatchSubtitleResult with either subtitles or an error message
+    """
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def extract_one(video: str) -> dict:
+        async with semaphore:
+            try:
+                video_id = get_video_id(video)
+                subtitles = await get_subtitles(video_id, request.languages)
+                return {"video": video, "subtitles": subtitles, "error": None}
+            except (InvalidVideoInputError, SubtitleExtractionError) as e:
+                return {"video": video, "subtitles": None, "error": str(e)}
+            except Exception as e:
+                return {
+                    "video": video,
+                    "subtitles": None,
+                    "error": f"Unexpected error: {str(e)}",
+                }
+
+    return await asyncio.gather(*map(extract_one, request.videos))
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -3,7 +3,11 @@
 __version__ = "0.1.0"
 
 from .constants import DEFAULT_LANGUAGES
-from .core.subtitle_extractor import extract_subtitles
+from .core.subtitle_extractor import (
+    extract_subtitles,
+    extract_subtitles_async,
+    get_video_id,
+)
 from ._exceptions import (
     InvalidVideoInputError,
     SubtitleExtractionError,
@@ -14,6 +18,8 @@ from ._exceptions import (
 
 __all__ = [
     "extract_subtitles",
+    "extract_subtitles_async",
+    "get_video_id",
     "SubtitlerError",
     "InvalidVideoInputError",
     "VideoIdExtractionError",
@@ -2,7 +2,7 @@
 
 
 # Top 20 languages by number of speakers
-DEFAULT_LANGUAGES: list[str] = [
+DEFAULT_LANGUAGES: tuple[str, ...] = (
     "en",
     "fr",
     "es",
@@ -32,19 +32,28 @@ DEFAULT_LANGUAGES: list[str] = [
     "vi",
     "yo",
     "zu",
-]
+)
 
 # Valid YouTube domains
-VALID_YOUTUBE_DOMAINS: set[str] = {
+VALID_YOUTUBE_DOMAINS: frozenset[str] = frozenset({
     "youtube.com",
     "www.youtube.com",
     "youtu.be",
     "m.youtube.com",
-}
+})
 
 # YouTube video ID length
 YOUTUBE_VIDEO_ID_LENGTH: int = 11
 
+# Longest video input (URL or ID) accepted, to bound parsing and caching
+MAX_VIDEO_INPUT_LENGTH: int = 2048
+
+# HTTP client settings for YouTube requests
+HTTP_CONNECT_TIMEOUT: float = 3.0
+HTTP_READ_TIMEOUT: float = 10.0
+HTTP_RETRIES: int = 3
+HTTP_RETRY_BACKOFF: float = 0.5
+
 # Test video IDs for development and testing
 TEST_VIDEO_IDS: list[str] = [
     "NgsWGfUlwJI",  # TED Talk with captions
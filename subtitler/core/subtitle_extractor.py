@@ -1,8 +1,14 @@
 """Core subtitle extraction functionality."""
 
-from urllib.parse import parse_qs, urlparse
-from typing import Optional
-
+import asyncio
+import re
+import threading
+from functools import lru_cache
+from typing import Optional, Sequence
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from youtube_transcript_api import (
     TranscriptsDisabled,
     VideoUnavailable,
@@ -11,25 +17,104 @@ from youtube_transcript_api import (
 
 from ..constants import (
     DEFAULT_LANGUAGES,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    MAX_VIDEO_INPUT_LENGTH,
     VALID_YOUTUBE_DOMAINS,
     YOUTUBE_VIDEO_ID_LENGTH,
 )
 from .._exceptions import (
     InvalidVideoInputError,
     SubtitleExtractionError,
-    VideoIdExtractionError,
+)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that applies a default timeout to every request."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        return super().send(request, **kwargs)
+
+
+def _create_http_client() -> Session:
+    """
+    Create an HTTP session for one extraction thread's YouTube requests.
+
+    Each worker thread owns one session (see _get_api) and makes one request
+    at a time, so the number of pooled keep-alive connections follows the
+    worker thread count without a separate pool size setting.
+
+    Idempotent GETs that hit a transient 5xx are retried with jittered
+    exponential backoff (ignoring Retry-After, so a server can't park the
+    worker thread); connection errors, timeouts and 429s are not retried,
+    and the final response is always handed back so
+    youtube_transcript_api can map it to its own errors (e.g. IpBlocked).
+
+    Returns:
+        A configured requests Session
+    """
+    retry = Retry(
+        total=HTTP_RETRIES,
+        connect=0,
+        read=0,
+        status=HTTP_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        backoff_jitter=HTTP_RETRY_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+    adapter = _TimeoutHTTPAdapter(max_retries=retry)
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# YouTubeTranscriptApi is not thread-safe, so each worker thread keeps its own
+# instance (and HTTP session) and reuses it across calls
+_thread_local = threading.local()
+
+
+def _get_api() -> YouTubeTranscriptApi:
+    """Return the YouTubeTranscriptApi instance for the current thread."""
+    api = getattr(_thread_local, "api", None)
+    if api is None:
+        api = YouTubeTranscriptApi(http_client=_create_http_client())
+        _thread_local.api = api
+    return api
+
+
+# Single-pass matcher for youtu.be/<id> and <youtube host>/watch?...v=<id> URLs
+_WATCH_HOSTS = "|".join(
+    re.escape(domain)
+    for domain in sorted(VALID_YOUTUBE_DOMAINS)
+    if domain != "youtu.be"
+)
+_VIDEO_ID_PATTERN = rf"[A-Za-z0-9_-]{{{YOUTUBE_VIDEO_ID_LENGTH}}}"
+_VIDEO_ID_RE = re.compile(rf"{_VIDEO_ID_PATTERN}\Z")
+_VIDEO_URL_RE = re.compile(
+    rf"(?i:https?)://(?:"
+    rf"(?i:youtu\.be)/({_VIDEO_ID_PATTERN})(?=[?#]|\Z)"
+    rf"|(?i:{_WATCH_HOSTS})/watch/?\?(?:[^#]*?&)?v=({_VIDEO_ID_PATTERN})(?=[&#]|\Z)"
+    rf")"
 )
 
 
 def extract_subtitles(
-    video_url: str, languages: Optional[list[str]] = None
+    video_url: str, languages: Optional[Sequence[str]] = None
 ) -> str:
     """
     Extract the subtitles/transcript for a YouTube video by its ID or URL.
 
     Args:
         video_url: The YouTube video ID or URL
-        languages: List of preferred languages (defaults to DEFAULT_LANGUAGES)
+        languages: Preferred languages in priority order (defaults to DEFAULT_LANGUAGES)
 
     Returns:
         The complete subtitles/transcript as a single string
@@ -38,17 +123,30 @@ def extract_subtitles(
         InvalidVideoInputError: If video_url is invalid
         SubtitleExtractionError: If subtitle extraction fails
     """
-    if not isinstance(video_url, str) or not video_url.strip():
-        raise InvalidVideoInputError(
-            "Video input must be a non-empty string")
+    return _extract_subtitles_for_id(get_video_id(video_url), languages)
+
+
+def _extract_subtitles_for_id(
+    video_id: str, languages: Optional[Sequence[str]] = None
+) -> str:
+    """
+    Extract subtitles for an already-resolved video ID.
+
+    Args:
+        video_id: Valid video ID, as returned by get_video_id
+        languages: Preferred languages in priority order (defaults to DEFAULT_LANGUAGES)
+
+    Returns:
+        The complete subtitles/transcript as a single string
 
-    video_id = _extract_video_id_from_input(video_url.strip())
+    Raises:
+        SubtitleExtractionError: If subtitle extraction fails
+    """
     languages = languages or DEFAULT_LANGUAGES
 
     try:
-        api = YouTubeTranscriptApi()
-        fetched_transcript = api.fetch(video_id, languages=languages)
-        return " ".join([snippet.text for snippet in fetched_transcript])
+        fetched_transcript = _get_api().fetch(video_id, languages=languages)
+        return " ".join(snippet.text for snippet in fetched_transcript)
 
     except TranscriptsDisabled as e:
         raise SubtitleExtractionError(
@@ -63,12 +161,64 @@ def extract_subtitles(
         ) from e
 
 
+async def extract_subtitles_async(
+    video_url: str, languages: Optional[Sequence[str]] = None
+) -> str:
+    """
+    Extract subtitles without blocking the running event loop.
+
+    The input is resolved on the calling thread; only the blocking fetch
+    runs in a worker thread, so many extractions can be in flight at once.
+
+    Args:
+        video_url: The YouTube video ID or URL
+        languages: Preferred languages in priority order (defaults to DEFAULT_LANGUAGES)
+
+    Returns:
+        The complete subtitles/transcript as a single string
+
+    Raises:
+        InvalidVideoInputError: If video_url is invalid
+        SubtitleExtractionError: If subtitle extraction fails
+    """
+    video_id = get_video_id(video_url)
+    return await asyncio.to_thread(
+        _extract_subtitles_for_id, video_id, languages
+    )
+
+
+def get_video_id(video_url: str) -> str:
+    """
+    Resolve a YouTube video ID or URL to its canonical video ID.
+
+    Args:
+        video_url: The YouTube video ID or URL
+
+    Returns:
+        Valid video ID
+
+    Raises:
+        InvalidVideoInputError: If video_url is invalid
+    """
+    video_url = video_url.strip() if isinstance(video_url, str) else ""
+    if not video_url:
+        raise InvalidVideoInputError(
+            "Video input must be a non-empty string")
+    if len(video_url) > MAX_VIDEO_INPUT_LENGTH:
+        raise InvalidVideoInputError(
+            f"Invalid video input: longer than {MAX_VIDEO_INPUT_LENGTH} characters"
+        )
+
+    return _extract_video_id_from_input(video_url)
+
+
+@lru_cache(maxsize=10_000)
 def _extract_video_id_from_input(video_url: str) -> str:
     """
     Extract video ID from either a URL or validate a direct video ID.
 
     Args:
-        video_url: YouTube URL or video ID
+        video_url: YouTube URL or video ID, already stripped of whitespace
 
     Returns:
         Valid video ID
@@ -76,14 +226,15 @@ def _extract_video_id_from_input(video_url: str) -> str:
     Raises:
         InvalidVideoInputError: If input is invalid
     """
-    # Check if it's a URL
-    if validate_youtube_url(video_url):
-        return extract_video_id(video_url)
-
-    # Check if it's a direct video ID
-    if validate_video_id(video_url):
+    # Check if it's a direct video ID (cheap, so try it first)
+    if len(video_url) == YOUTUBE_VIDEO_ID_LENGTH and _VIDEO_ID_RE.match(video_url):
         return video_url
 
+    # Check if it's a URL
+    video_id = _match_video_url(video_url)
+    if video_id is not None:
+        return video_id
+
     raise InvalidVideoInputError(
         f"Invalid video input: {video_url}. Must be a valid YouTube URL or 11-character video ID"
     )
@@ -92,6 +243,30 @@ def _extract_video_id_from_input(video_url: str) -> str:
 # ---- Inlined helpers (moved from subtitler/utils/url_parser.py) ----
 
 
+def parse_video_id(url: str) -> Optional[str]:
+    """
+    Validate a YouTube URL and extract its video ID in a single pass.
+
+    Args:
+        url: The URL string to parse
+
+    Returns:
+        The video ID if the URL is a valid YouTube video URL, None otherwise
+    """
+    if not isinstance(url, str):
+        return None
+
+    return _match_video_url(url.strip())
+
+
+def _match_video_url(url: str) -> Optional[str]:
+    """Return the video ID from an already-stripped YouTube URL, or None."""
+    match = _VIDEO_URL_RE.match(url)
+    if match is None:
+        return None
+    return match.group(1) or match.group(2)
+
+
 def validate_youtube_url(url: str) -> bool:
     """
     Validate that the provided URL is a valid YouTube video URL.
@@ -102,40 +277,7 @@ def validate_youtube_url(url: str) -> bool:
     Returns:
         True if the URL is a valid YouTube video URL, False otherwise
     """
-    if not isinstance(url, str) or not url.strip():
-        return False
-
-    try:
-        parsed = urlparse(url.strip())
-
-        # Check for valid YouTube domains
-        if parsed.netloc.lower() not in VALID_YOUTUBE_DOMAINS:
-            return False
-
-        # For youtu.be format
-        if parsed.netloc.lower() == "youtu.be":
-            # Path should contain video ID (11 characters)
-            video_id = parsed.path.lstrip("/")
-            return (
-                len(video_id) == YOUTUBE_VIDEO_ID_LENGTH
-                and video_id.replace("_", "").replace("-", "").isalnum()
-            )
-
-        # For youtube.com format
-        if parsed.path in ["/watch", "/watch/"]:
-            query_params = parse_qs(parsed.query)
-            if "v" in query_params and query_params["v"]:
-                video_id = query_params["v"][0]
-
-                return (
-                    len(video_id) == YOUTUBE_VIDEO_ID_LENGTH
-                    and video_id.replace("_", "").replace("-", "").isalnum()
-                )
-
-        return False
-
-    except Exception:
-        return False
+    return parse_video_id(url) is not None
 
 
 def extract_video_id(url: str) -> str:
@@ -150,32 +292,11 @@ def extract_video_id(url: str) -> str:
 
     Raises:
         InvalidVideoInputError: If the URL is invalid
-        VideoIdExtractionError: If video ID cannot be extracted
     """
-    if not validate_youtube_url(url):
+    video_id = parse_video_id(url)
+    if video_id is None:
         raise InvalidVideoInputError(f"Invalid YouTube URL: {url}")
-
-    try:
-        parsed = urlparse(url.strip())
-
-        # For youtu.be format
-        if parsed.netloc.lower() == "youtu.be":
-            return parsed.path.lstrip("/")
-
-        # For youtube.com format
-        if parsed.path in ["/watch", "/watch/"]:
-            query_params = parse_qs(parsed.query)
-            if "v" in query_params and query_params["v"]:
-                return query_params["v"][0]
-
-        raise VideoIdExtractionError(
-            f"Could not extract video ID from URL: {url}")
-
-    except (InvalidVideoInputError, VideoIdExtractionError):
-        raise
-    except Exception as e:
-        raise VideoIdExtractionError(
-            f"Failed to extract video ID: {str(e)}") from e
+    return video_id
 
 
 def validate_video_id(video_id: str) -> bool:
@@ -188,11 +309,7 @@ def validate_video_id(video_id: str) -> bool:
     Returns:
         True if the video ID is valid, False otherwise
     """
-    if not isinstance(video_id, str) or not video_id.strip():
+    if not isinstance(video_id, str):
         return False
 
-    video_id = video_id.strip()
-    return (
-        len(video_id) == YOUTUBE_VIDEO_ID_LENGTH
-        and video_id.replace("_", "").replace("-", "").isalnum()
-    )
+    return _VIDEO_ID_RE.match(video_id.strip()) is not None
@@ -0,0 +1,220 @@
+"""Tests for the FastAPI web service."""
+
+import os
+import zlib
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from redis.exceptions import RedisError
+
+os.environ.setdefault("API_KEY", "test-api-key")
+
+import main  # noqa: E402
+
+
+AUTH_HEADERS = {"Authorization": f"Bearer {os.environ['API_KEY']}"}
+
+
+class StubRedis:
+    """Minimal in-memory stand-in for the redis.asyncio client."""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise RedisError("connection refused")
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        if self.fail:
+            raise RedisError("connection refused")
+        self.data[key] = value
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def mock_api():
+    """Patch the YouTube API so no network calls are made."""
+    with patch("subtitler.core.subtitle_extractor._get_api") as mock_get_api:
+        mock_api = mock_get_api.return_value
+        mock_api.fetch.return_value = [Mock(text="Hello"), Mock(text="world")]
+        yield mock_api
+
+
+@pytest.fixture
+def client():
+    """Test client with the app lifespan running and no Redis configured."""
+    with TestClient(main.app) as client:
+        yield client
+
+
+class TestExtractSubtitlesEndpoint:
+    """Test cases for the single video endpoint and its cache."""
+
+    def test_requires_valid_api_key(self, client):
+        """Test that a wrong API key is rejected."""
+        response = client.post(
+            "/extract-subtitles",
+            json={"video_url": "dQw4w9WgXcQ"},
+            headers={"Authorization": "Bearer wrong-key"},
+        )
+        assert response.status_code == 401
+
+    def test_invalid_input(self, client, mock_api):
+        """Test that invalid video input returns 400."""
+        response = client.post(
+            "/extract-subtitles", json={"video_url": "not_a_url"}, headers=AUTH_HEADERS
+        )
+        assert response.status_code == 400
+        assert "Invalid video input" in response.json()["detail"]
+
+    def test_without_cache(self, client, mock_api):
+        """Test extraction when Redis is not configured."""
+        response = client.post(
+            "/extract-subtitles",
+            json={"video_url": "https://youtu.be/dQw4w9WgXcQ"},
+            headers=AUTH_HEADERS,
+        )
+        assert response.status_code == 200
+        assert response.json() == {"subtitles": "Hello world"}
+
+    def test_input_resolved_once(self, client, mock_api):
+        """Test that the endpoint does not re-resolve the video ID on extraction."""
+        with patch(
+            "subtitler.core.subtitle_extractor.get_video_id"
+        ) as extractor_get_video_id:
+            response = client.post(
+                "/extract-subtitles",
+                json={"video_url": " https://youtu.be/dQw4w9WgXcQ "},
+                headers=AUTH_HEADERS,
+            )
+
+        assert response.json() == {"subtitles": "Hello world"}
+        extractor_get_video_id.assert_not_called()
+        mock_api.fetch.assert_called_once_with(
+            "dQw4w9WgXcQ", languages=main.DEFAULT_LANGUAGES
+        )
+
+    def test_cache_miss_stores_result(self, client, mock_api):
+        """Test that a cache miss extracts and stores the subtitles."""
+        redis = StubRedis()
+        client.app.state.redis = redis
+
+        response = client.post(
+            "/extract-subtitles", json={"video_url": "dQw4w9WgXcQ"}, headers=AUTH_HEADERS
+        )
+
+        assert response.json() == {"subtitles": "Hello world"}
+        assert [zlib.decompress(v).decode() for v in redis.data.values()] == [
+            "Hello world"
+        ]
+
+    def test_cache_hit_skips_extraction(self, client, mock_api):
+        """Test that URL variants of a cached video are served from the cache."""
+        client.app.state.redis = StubRedis()
+        client.post(
+            "/extract-subtitles", json={"video_url": "dQw4w9WgXcQ"}, headers=AUTH_HEADERS
+        )
+
+        response = client.post(
+            "/extract-subtitles",
+            json={"video_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=1"},
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.json() == {"subtitles": "Hello world"}
+        mock_api.fetch.assert_called_once()
+
+    def test_cache_key_depends_on_languages(self, client, mock_api):
+        """Test that different language preferences are cached separately."""
+        client.app.state.redis = StubRedis()
+        for languages in (["en", "fr"], ["fr", "en"]):
+            client.post(
+                "/extract-subtitles",
+                json={"video_url": "dQw4w9WgXcQ", "languages": languages},
+                headers=AUTH_HEADERS,
+            )
+        assert mock_api.fetch.call_count == 2
+
+    def test_redis_unavailable(self, client, mock_api):
+        """Test that Redis errors fall back to extraction."""
+        client.app.state.redis = StubRedis(fail=True)
+
+        response = client.post(
+            "/extract-subtitles", json={"video_url": "dQw4w9WgXcQ"}, headers=AUTH_HEADERS
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"subtitles": "Hello world"}
+
+    @pytest.mark.parametrize(
+        "cached_value", [b"not zlib data", zlib.compress(b"\xff\xfe")]
+    )
+    def test_unreadable_cache_entry(self, client, mock_api, cached_value):
+        """Test that corrupt cache entries are treated as misses and replaced."""
+        redis = StubRedis()
+        client.app.state.redis = redis
+        key = main._cache_key("dQw4w9WgXcQ", main.DEFAULT_LANGUAGES)
+        redis.data[key] = cached_value
+
+        response = client.post(
+            "/extract-subtitles", json={"video_url": "dQw4w9WgXcQ"}, headers=AUTH_HEADERS
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"subtitles": "Hello world"}
+        assert zlib.decompress(redis.data[key]).decode() == "Hello world"
+
+
+class TestExtractSubtitlesBatchEndpoint:
+    """Test cases for the batch endpoint."""
+
+    def test_results_in_request_order(self, client, mock_api):
+        """Test that results come back in the order the videos were sent."""
+        mock_api.fetch.side_effect = lambda video_id, languages: [Mock(text=video_id)]
+        videos = ["NgsWGfUlwJI", "https://youtu.be/dQw4w9WgXcQ", "fGkCY5z3D_c"]
+
+        response = client.post(
+            "/extract-subtitles/batch", json={"videos": videos}, headers=AUTH_HEADERS
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"video": "NgsWGfUlwJI", "subtitles": "NgsWGfUlwJI", "error": None},
+            {
+                "video": "https://youtu.be/dQw4w9WgXcQ",
+                "subtitles": "dQw4w9WgXcQ",
+                "error": None,
+            },
+            {"video": "fGkCY5z3D_c", "subtitles": "fGkCY5z3D_c", "error": None},
+        ]
+
+    def test_bad_input_does_not_fail_batch(self, client, mock_api):
+        """Test that one invalid video yields a per-item error only."""
+        response = client.post(
+            "/extract-subtitles/batch",
+            json={"videos": ["dQw4w9WgXcQ", "not_a_url"]},
+            headers=AUTH_HEADERS,
+        )
+
+        assert response.status_code == 200
+        good, bad = response.json()
+        assert good == {"video": "dQw4w9WgXcQ", "subtitles": "Hello world", "error": None}
+        assert bad["subtitles"] is None
+        assert "Invalid video input" in bad["error"]
+
+    @pytest.mark.parametrize(
+        "videos", [[], ["dQw4w9WgXcQ"] * (main.BATCH_MAX_VIDEOS + 1)]
+    )
+    def test_batch_size_limits(self, client, mock_api, videos):
+        """Test that empty and oversized batches are rejected."""
+        response = client.post(
+            "/extract-subtitles/batch", json={"videos": videos}, headers=AUTH_HEADERS
+        )
+        assert response.status_code == 422
+        mock_api.fetch.assert_not_called()
@@ -1,5 +1,6 @@
 """Tests for the subtitle extraction functions."""
 
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
@@ -10,6 +11,8 @@ from subtitler import (
     InvalidVideoInputError,
     SubtitleExtractionError,
     extract_subtitles,
+    extract_subtitles_async,
+    get_video_id,
 )
 from subtitler.constants import TEST_VIDEO_IDS, TEST_VIDEO_URLS
 
@@ -147,43 +150,41 @@ class TestSubtitleExtractor:
         with pytest.raises(SubtitleExtractionError, match="Video .* is unavailable"):
             extract_subtitles(unavailable_video_id)
 
-    @patch("subtitler.core.subtitle_extractor.YouTubeTranscriptApi")
-    def test_extract_subtitles_transcripts_disabled(self, mock_api_class):
+    @patch("subtitler.core.subtitle_extractor._get_api")
+    def test_extract_subtitles_transcripts_disabled(self, mock_get_api):
         """Test handling of TranscriptsDisabled exception."""
-        mock_api = Mock()
+        mock_api = mock_get_api.return_value
         mock_api.fetch.side_effect = TranscriptsDisabled("video_id")
-        mock_api_class.return_value = mock_api
 
         with pytest.raises(
             SubtitleExtractionError, match="Subtitles are disabled for video"
         ):
             extract_subtitles("dQw4w9WgXcQ")
 
-    @patch("subtitler.core.subtitle_extractor.YouTubeTranscriptApi")
-    def test_extract_subtitles_video_unavailable(self, mock_api_class):
+    @patch("subtitler.core.subtitle_extractor._get_api")
+    def test_extract_subtitles_video_unavailable(self, mock_get_api):
         """Test handling of VideoUnavailable exception."""
-        mock_api = Mock()
+        mock_api = mock_get_api.return_value
         mock_api.fetch.side_effect = VideoUnavailable("video_id")
-        mock_api_class.return_value = mock_api
 
         with pytest.raises(SubtitleExtractionError, match="Video .* is unavailable"):
             extract_subtitles("dQw4w9WgXcQ")
 
-    @patch("subtitler.core.subtitle_extractor.YouTubeTranscriptApi")
-    def test_extract_subtitles_generic_exception(self, mock_api_class):
+    @patch("subtitler.core.subtitle_extractor._get_api")
+    def test_extract_subtitles_generic_exception(self, mock_get_api):
         """Test handling of generic exceptions."""
-        mock_api = Mock()
+        mock_api = mock_get_api.return_value
         mock_api.fetch.side_effect = Exception("Generic error")
-        mock_api_class.return_value = mock_api
 
         with pytest.raises(
             SubtitleExtractionError, match="Failed to extract subtitles"
         ):
             extract_subtitles("dQw4w9WgXcQ")
 
-    @patch("subtitler.core.subtitle_extractor.YouTubeTranscriptApi")
-    def test_extract_subtitles_success_mock(self, mock_api_class):
+    @patch("subtitler.core.subtitle_extractor._get_api")
+    def test_extract_subtitles_success_mock(self, mock_get_api):
         """Test successful subtitle extraction with mocked response."""
+        mock_api = mock_get_api.return_value
         # Mock transcript data
         mock_transcript = [
             Mock(text="Hello world"),
@@ -191,9 +192,7 @@ class TestSubtitleExtractor:
             Mock(text="YouTube transcript"),
         ]
 
-        mock_api = Mock()
         mock_api.fetch.return_value = mock_transcript
-        mock_api_class.return_value = mock_api
 
         result = extract_subtitles("dQw4w9WgXcQ")
 
@@ -202,6 +201,62 @@ class TestSubtitleExtractor:
             "dQw4w9WgXcQ", languages=DEFAULT_LANGUAGES
         )
 
+    @patch("subtitler.core.subtitle_extractor._get_api")
+    def test_extract_subtitles_async_success_mock(self, mock_get_api):
+        """Test async subtitle extraction with mocked response."""
+        mock_api = mock_get_api.return_value
+        mock_api.fetch.return_value = [Mock(text="Hello"), Mock(text="world")]
+
+        result = asyncio.run(extract_subtitles_async("dQw4w9WgXcQ"))
+
+        assert result == "Hello world"
+
+    def test_extract_subtitles_async_invalid_input(self):
+        """Test that async extraction propagates InvalidVideoInputError."""
+        with pytest.raises(InvalidVideoInputError, match="Invalid video input"):
+            asyncio.run(extract_subtitles_async("not_a_url_at_all"))
+
+    @pytest.mark.parametrize(
+        "video_input",
+        [
+            "dQw4w9WgXcQ",
+            "  dQw4w9WgXcQ  ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=RDdQw4w9WgXcQ",
+        ],
+    )
+    def test_get_video_id(self, video_input):
+        """Test that IDs and URL variants resolve to the same video ID."""
+        assert get_video_id(video_input) == "dQw4w9WgXcQ"
+
+    def test_get_video_id_empty_input(self):
+        """Test that empty input raises InvalidVideoInputError."""
+        with pytest.raises(
+            InvalidVideoInputError, match="Video input must be a non-empty string"
+        ):
+            get_video_id("")
+
+    def test_get_api_is_per_thread(self):
+        """Test that each thread gets its own reusable API instance."""
+        from concurrent.futures import ThreadPoolExecutor
+        from subtitler.core.subtitle_extractor import _get_api
+        assert _get_api() is _get_api()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(_get_api).result()
+        assert other is not _get_api()
+
+    def test_http_client_retries(self):
+        """Test that the HTTP client only retries transient server errors."""
+        from subtitler.constants import HTTP_RETRIES
+        from subtitler.core.subtitle_extractor import _create_http_client
+        adapter = _create_http_client().get_adapter("https://www.youtube.com")
+        assert adapter.max_retries.total == HTTP_RETRIES
+        assert 429 not in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.connect == 0
+        assert adapter.max_retries.read == 0
+        assert adapter.max_retries.raise_on_status is False
+        assert adapter.max_retries.respect_retry_after_header is False
+
     def test_extract_video_id_from_input_valid_id(self):
         """Test extracting video ID from valid video ID input."""
         from subtitler.core.subtitle_extractor import _extract_video_id_from_input
@@ -222,6 +277,51 @@ class TestSubtitleExtractor:
         with pytest.raises(InvalidVideoInputError, match="Invalid video input"):
             _extract_video_id_from_input("invalid_input")
 
+    def test_get_video_id_rejects_oversized_input(self):
+        """Test that very long inputs are rejected before reaching the parse cache."""
+        from subtitler.core.subtitle_extractor import _extract_video_id_from_input
+        from subtitler.constants import MAX_VIDEO_INPUT_LENGTH
+        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ&x="
+        url += "a" * (MAX_VIDEO_INPUT_LENGTH - len(url) + 1)
+        _extract_video_id_from_input.cache_clear()
+        with pytest.raises(InvalidVideoInputError, match="longer than"):
+            get_video_id(url)
+        assert _extract_video_id_from_input.cache_info().currsize == 0
+
+    def test_extract_video_id_from_input_is_cached(self):
+        """Test that repeated inputs are served from the parse cache."""
+        from subtitler.core.subtitle_extractor import _extract_video_id_from_input
+        url = "https://www.youtube.com/watch?v=NgsWGfUlwJI&t=42"
+        _extract_video_id_from_input.cache_clear()
+        _extract_video_id_from_input(url)
+        assert _extract_video_id_from_input(url) == "NgsWGfUlwJI"
+        assert _extract_video_id_from_input.cache_info().hits == 1
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://youtu.be/dQw4w9WgXcQ?t=42", True),
+            ("https://m.youtube.com/watch?v=dQw4w9WgXcQ", True),
+            ("HTTPS://WWW.YOUTUBE.COM/watch/?t=42&v=dQw4w9WgXcQ#top", True),
+            ("https://vimeo.com/watch?v=dQw4w9WgXcQ", False),
+            ("https://youtube.com.evil.com/watch?v=dQw4w9WgXcQ", False),
+            ("https://youtube.com/embed?v=dQw4w9WgXcQ", False),
+            ("https://youtube.com/watch?xv=dQw4w9WgXcQ", False),
+            ("https://youtu.be/dQw4w9WgXcQ/extra", False),
+        ],
+    )
+    def test_validate_youtube_url(self, url, expected):
+        """Test URL validation against accepted and rejected URL forms."""
+        from subtitler.core.subtitle_extractor import validate_youtube_url
+        assert validate_youtube_url(url) is expected
+
+    def test_parse_video_id(self):
+        """Test that parse_video_id returns the ID or None in one call."""
+        from subtitler.core.subtitle_extractor import parse_video_id
+        assert parse_video_id("https://youtu.be/ITMouQ_EuXI") == "ITMouQ_EuXI"
+        assert parse_video_id("https://www.google.com") is None
+        assert parse_video_id(None) is None
+
     def test_extract_video_id_from_input_with_underscore(self):
         """Test extracting video ID from URL with underscore in video ID."""
         from subtitler.core.subtitle_extractor import _extract_video_id_from_input